@@ -11,9 +11,10 @@ Format of package folder:
 ADDON_REPO/package/{addon name}/{addon version}
 
 You can specify `--output_dir` in arguments to change output directory where
-package will be created. Existing package directory will be always purged if
-already present! This could be used to create package directly in server folder
-if available.
+package will be created. Files in existing package directory are updated only
+if they changed, use `--force` to purge the directory first. Directories of
+other addon versions are always removed. This could be used to create package
+directly in server folder if available.
 
 Package contains server side files directly,
 client side code zipped in `private` subfolder.
@@ -29,35 +30,56 @@ import platform
 import logging
 import collections
 import zipfile
-from typing import Optional, Any, Pattern
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Any, Iterator, Pattern
+
+try:
+    # Optional libdeflate bindings, faster than zlib if available
+    import deflate
+except ImportError:
+    deflate = None
 
 COMMON_DIR_NAME: str = "ftrack_common"
 ADDON_NAME: str = "ftrack"
 ADDON_CLIENT_DIR: str = "ayon_ftrack"
+# Package is uploaded right after creation so speed is preferred over size
+DEFAULT_COMPRESS_LEVEL: int = 1
 
 # Patterns of directories to be skipped for server part of addon
-IGNORE_DIR_PATTERNS: list[Pattern] = [
-    re.compile(pattern)
-    for pattern in {
-        # Skip directories starting with '.'
-        r"^\.",
-        # Skip any pycache folders
-        "^__pycache__$"
-    }
+IGNORE_DIR_PATTERNS: list[str] = [
+    # Skip directories starting with '.'
+    r"^\.",
+    # Skip any pycache folders
+    "^__pycache__$"
 ]
 
 # Patterns of files to be skipped for server part of addon
-IGNORE_FILE_PATTERNS: list[Pattern] = [
-    re.compile(pattern)
-    for pattern in {
-        # Skip files starting with '.'
-        # NOTE this could be an issue in some cases
-        r"^\.",
-        # Skip '.pyc' files
-        r"\.pyc$"
-    }
+IGNORE_FILE_PATTERNS: list[str] = [
+    # Skip files starting with '.'
+    # NOTE this could be an issue in some cases
+    r"^\.",
+    # Skip '.pyc' files
+    r"\.pyc$"
 ]
 
+# Patterns combined to single regex so only one search per name is needed
+IGNORE_DIR_RE: Pattern = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in IGNORE_DIR_PATTERNS)
+)
+IGNORE_FILE_RE: Pattern = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in IGNORE_FILE_PATTERNS)
+)
+
+# Extensions of already compressed files which are stored in zip
+#   without compression
+STORE_FILE_EXTENSIONS: set[str] = {
+    ".png", ".jpg", ".jpeg", ".gif", ".zip", ".gz", ".whl"
+}
+
+# Directories already created by 'safe_copy_file'
+_MADE_DIRS: set[str] = set()
+
 
 class ZipFileLongPaths(zipfile.ZipFile):
     """Allows longer paths in zip files.
@@ -81,118 +103,331 @@ class ZipFileLongPaths(zipfile.ZipFile):
             member, tpath, pwd
         )
 
+    def write_compressed(self, zinfo: zipfile.ZipInfo, compressed: bytes):
+        """Write member which content was already compressed.
+
+        Information about crc and sizes must be already filled on 'zinfo'.
+
+        Args:
+            zinfo (zipfile.ZipInfo): Zip info of the member.
+            compressed (bytes): Compressed content of the member.
+        """
+        # There is no public api to write already compressed data. This
+        #   mirrors 'ZipFile._open_to_write' (CPython 3.11) without the
+        #   compressor, keep it in sync when CPython changes it.
+        # - crc and sizes are known before the local header is written, so
+        #   data descriptor flag is not needed even for unseekable output
+        if self._writing:
+            raise ValueError(
+                "Can't write to ZIP archive while an open writing"
+                " handle exists"
+            )
+
+        zinfo.flag_bits = 0x00
+        if not zinfo.external_attr:
+            zinfo.external_attr = 0o600 << 16
+
+        zip64 = zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+        if zip64 and not self._allowZip64:
+            raise zipfile.LargeZipFile(
+                "Filesize would require ZIP64 extensions"
+            )
+
+        with self._lock:
+            if self._seekable:
+                self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self._writecheck(zinfo)
+            self._didModify = True
+            self.fp.write(zinfo.FileHeader(zip64))
+            self.fp.write(compressed)
+            self.start_dir = self.fp.tell()
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
+
+
+def _deflate_bytes(data: bytes, level: int) -> bytes:
+    """Compress data to raw DEFLATE stream.
+
+    Uses libdeflate if available, otherwise zlib is used.
 
-def safe_copy_file(src_path: str, dst_path: str):
+    Args:
+        data (bytes): Data to compress.
+        level (int): Compression level.
+
+    Returns:
+        bytes: Raw DEFLATE stream without zlib header and footer.
+    """
+    if deflate is not None:
+        return deflate.deflate_compress(data, level)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _compress_file(
+    src_path: str,
+    dst_path: str,
+    compress_level: int
+) -> tuple[zipfile.ZipInfo, bytes]:
+    """Read and compress file for zip.
+
+    Files with extension from 'STORE_FILE_EXTENSIONS' are not compressed,
+    same as all files with compression level 0.
+
+    Args:
+        src_path (str): Path to source file.
+        dst_path (str): Path of file inside zip.
+        compress_level (int): Compression level.
+
+    Returns:
+        tuple[zipfile.ZipInfo, bytes]: Zip info with filled crc and sizes,
+            and compressed content.
+    """
+    zinfo = zipfile.ZipInfo.from_file(src_path, dst_path)
+    with open(src_path, "rb") as stream:
+        data: bytes = stream.read()
+    ext: str = os.path.splitext(src_path)[1].lower()
+    # Level 0 is not supported by libdeflate
+    if compress_level == 0 or ext in STORE_FILE_EXTENSIONS:
+        compressed: bytes = data
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        compressed: bytes = _deflate_bytes(data, compress_level)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.CRC = zlib.crc32(data)
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(compressed)
+    return zinfo, compressed
+
+
+def zip_write_files(
+    zipf: ZipFileLongPaths,
+    filepaths: list[tuple[str, str]],
+    compress_level: int = DEFAULT_COMPRESS_LEVEL
+):
+    """Write files to zip.
+
+    Files are compressed in parallel threads, both zlib and libdeflate
+    release GIL during compression. Compressed content is then written to
+    zip in the same order as files were passed. Only a limited number of
+    files is compressed ahead of writing, so the whole batch is not held
+    in memory at once.
+
+    Args:
+        zipf (ZipFileLongPaths): Zip file opened for writing.
+        filepaths (list[tuple[str, str]]): Source file paths with paths
+            of files inside zip.
+        compress_level (int): Compression level.
+    """
+    max_workers: int = os.cpu_count() or 1
+    max_pending: int = max_workers * 4
+    pending: collections.deque[Future] = collections.deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for src_path, dst_path in filepaths:
+            if len(pending) >= max_pending:
+                zipf.write_compressed(*pending.popleft().result())
+            pending.append(executor.submit(
+                _compress_file, src_path, dst_path, compress_level
+            ))
+
+        while pending:
+            zipf.write_compressed(*pending.popleft().result())
+
+
+def safe_copy_file(src_path: str, dst_path: str, incremental: bool = True):
     """Copy file and make sure destination directory exists.
 
-    Ignore if destination already contains directories from source.
+    Created destination directories are cached to avoid redundant
+    'os.makedirs' calls.
 
     Args:
         src_path (str): File path that will be copied.
         dst_path (str): Path to destination file.
+        incremental (bool): Skip copy if destination file has same size
+            and modification time. File metadata are copied too so next
+            copy can be skipped. Only content is copied if disabled.
     """
 
     if src_path == dst_path:
         return
 
     dst_dir: str = os.path.dirname(dst_path)
+    if dst_dir not in _MADE_DIRS:
+        os.makedirs(dst_dir, exist_ok=True)
+        _MADE_DIRS.add(dst_dir)
+
+    if not incremental:
+        shutil.copyfile(src_path, dst_path)
+        return
+
     try:
-        os.makedirs(dst_dir)
-    except Exception:
+        src_stat: os.stat_result = os.stat(src_path)
+        dst_stat: os.stat_result = os.stat(dst_path)
+        if (
+            src_stat.st_size == dst_stat.st_size
+            and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+        ):
+            return
+    except FileNotFoundError:
         pass
 
     shutil.copy2(src_path, dst_path)
 
 
-def _value_match_regexes(value: str, regexes: list[Pattern]) -> bool:
-    for regex in regexes:
-        if regex.search(value):
-            return True
-    return False
+def iter_files(
+    src_path: str,
+    ignore_file_regex: Pattern = IGNORE_FILE_RE,
+    ignore_dir_regex: Pattern = IGNORE_DIR_RE
+) -> Iterator[tuple[str, str]]:
+    """Iterate files in directory recursively.
 
+    Args:
+        src_path (str): Root directory path.
+        ignore_file_regex (Pattern): Regex of file names to skip.
+        ignore_dir_regex (Pattern): Regex of directory names to skip.
 
-def find_files_in_subdir(
-    src_path: str,
-    ignore_file_patterns: Optional[list[Pattern]] = None,
-    ignore_dir_patterns: Optional[list[Pattern]] = None
-) -> list[tuple[str, str]]:
-    if ignore_file_patterns is None:
-        ignore_file_patterns: list[Pattern] = IGNORE_FILE_PATTERNS
+    Yields:
+        tuple[str, str]: File path and its sub-path relative to 'src_path'
+            with '/' as separator.
+    """
+    src_path_offset = len(src_path) + 1
+    for dirpath, dirnames, filenames in os.walk(src_path):
+        # Prune ignored directories so walk does not go into them
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if ignore_dir_regex.search(dirname) is None
+        ]
+        # Prefix is same for all files in directory, sub-paths use '/'
+        #   as separator which is used in zip files
+        prefix = ""
+        if dirpath != src_path:
+            prefix = dirpath[src_path_offset:].replace(os.path.sep, "/") + "/"
+
+        for filename in filenames:
+            if ignore_file_regex.search(filename) is None:
+                yield os.path.join(dirpath, filename), prefix + filename
+
+
+def remove_stale_files(
+    addon_output_dir: str,
+    filepaths: list[tuple[str, str]],
+    log: logging.Logger
+):
+    """Remove files from 'addon_output_dir' which are not in sources.
 
-    if ignore_dir_patterns is None:
-        ignore_dir_patterns: list[Pattern] = IGNORE_DIR_PATTERNS
-    output: list[tuple[str, str]] = []
+    Content of 'private' directory, created by 'zip_client_side', is kept.
+    Directories which become empty are removed too.
 
-    hierarchy_queue: collections.deque[tuple[str, list[str]]] = (
-        collections.deque()
-    )
-    hierarchy_queue.append((src_path, []))
-    while hierarchy_queue:
-        item = hierarchy_queue.popleft()
-        dirpath, parents = item
-        for name in os.listdir(dirpath):
-            path = os.path.join(dirpath, name)
-            if os.path.isfile(path):
-                if not _value_match_regexes(name, ignore_file_patterns):
-                    items = list(parents)
-                    items.append(name)
-                    output.append((path, os.path.sep.join(items)))
-                continue
+    Args:
+        addon_output_dir (str): Directory path to addon output directory.
+        filepaths (list[tuple[str, str]]): Source file paths with their
+            sub-paths in addon package.
+        log (logging.Logger): Logger object.
+    """
+    expected_sub_paths: set[str] = {
+        os.path.normpath(sub_path)
+        for _, sub_path in filepaths
+    }
+    private_dir: str = os.path.join(addon_output_dir, "private")
+    addon_output_dir_offset = len(addon_output_dir) + 1
+    for root, _, filenames in os.walk(addon_output_dir, topdown=False):
+        if root == private_dir or root.startswith(private_dir + os.path.sep):
+            continue
+
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            sub_path = path[addon_output_dir_offset:]
+            if sub_path not in expected_sub_paths:
+                log.info(f"Removing stale file {sub_path}")
+                os.remove(path)
+
+        if root != addon_output_dir and not os.listdir(root):
+            os.rmdir(root)
+            _MADE_DIRS.discard(root)
+
+
+def remove_other_versions(
+    addon_output_root: str,
+    addon_version: str,
+    log: logging.Logger
+):
+    """Remove content of 'addon_output_root' other than current version.
 
-            if not _value_match_regexes(name, ignore_dir_patterns):
-                items = list(parents)
-                items.append(name)
-                hierarchy_queue.append((path, items))
+    Args:
+        addon_output_root (str): Directory path with addon versions.
+        addon_version (str): Version of addon which is kept.
+        log (logging.Logger): Logger object.
+    """
+    if not os.path.isdir(addon_output_root):
+        return
 
-    return output
+    with os.scandir(addon_output_root) as entries:
+        for entry in entries:
+            if entry.name == addon_version:
+                continue
+            log.info(f"Removing {entry.path}")
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+    _MADE_DIRS.clear()
 
 
 def copy_server_content(
     addon_output_dir: str,
     current_dir: str,
-    log: logging.Logger
-):
+    log: logging.Logger,
+    copy_files: bool = True,
+    incremental: bool = True
+) -> list[tuple[str, str]]:
     """Copies server side folders to 'addon_package_dir'
 
     Args:
         addon_output_dir (str): package dir in addon repo dir
         current_dir (str): addon repo dir
         log (logging.Logger)
+        copy_files (bool): Copy files to 'addon_output_dir'. Only server
+            files are collected if disabled.
+        incremental (bool): Skip copy of unchanged files. Files which are
+            not in sources anymore are removed from 'addon_output_dir'.
+
+    Returns:
+        list[tuple[str, str]]: Source file paths with their sub-paths
+            in addon package.
     """
 
-    log.info("Copying server content")
-
     server_dir: str = os.path.join(current_dir, "server")
     common_dir: str = os.path.join(current_dir, COMMON_DIR_NAME)
 
-    filepaths_to_copy: list[tuple[str, str]] = [
-        (
-            os.path.join(current_dir, "version.py"),
-            os.path.join(addon_output_dir, "version.py")
-        ),
+    filepaths: list[tuple[str, str]] = [
+        (os.path.join(current_dir, "version.py"), "version.py"),
         # Copy constants needed for attributes creation
-        (
-            os.path.join(common_dir, "constants.py"),
-            os.path.join(addon_output_dir, "constants.py")
-        ),
+        (os.path.join(common_dir, "constants.py"), "constants.py"),
     ]
+    filepaths.extend(iter_files(server_dir))
 
-    for path, sub_path in find_files_in_subdir(server_dir):
-        filepaths_to_copy.append(
-            (path, os.path.join(addon_output_dir, sub_path))
-        )
+    if copy_files:
+        log.info("Copying server content")
+        for src_path, sub_path in filepaths:
+            safe_copy_file(
+                src_path,
+                os.path.join(addon_output_dir, sub_path),
+                incremental
+            )
 
-    # Copy files
-    for src_path, dst_path in filepaths_to_copy:
-        safe_copy_file(src_path, dst_path)
+        if incremental:
+            remove_stale_files(addon_output_dir, filepaths, log)
+    return filepaths
 
 
 def zip_client_side(
     addon_package_dir: str,
     current_dir: str,
     log: logging.Logger,
-    zip_basename: Optional[str] = None
-):
+    zip_basename: Optional[str] = None,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL
+) -> list[tuple[str, str]]:
     """Copy and zip `client` content into `addon_package_dir'.
 
     Args:
@@ -201,12 +436,17 @@ def zip_client_side(
         zip_basename (str): Output zip file name in format. 'client' by
             default.
         log (logging.Logger): Logger object.
+        compress_level (int): Compression level of zip file.
+
+    Returns:
+        list[tuple[str, str]]: Paths to created files with their sub-paths
+            in addon package.
     """
 
     client_dir: str = os.path.join(current_dir, "client")
     if not os.path.isdir(client_dir):
         log.info("Client directory was not found. Skipping")
-        return
+        return []
 
     if not zip_basename:
         zip_basename = "client"
@@ -219,28 +459,44 @@ def zip_client_side(
     version_filepath: str = os.path.join(current_dir, "version.py")
     addon_subdir_path = os.path.join(client_dir, ADDON_CLIENT_DIR)
 
+    # Collect all files first so they're zipped as one batch
+    filepaths_to_zip: list[tuple[str, str]] = [
+        (path, "/".join((ADDON_CLIENT_DIR, sub_path)))
+        for path, sub_path in iter_files(addon_subdir_path)
+    ]
+    filepaths_to_zip.extend(
+        (path, "/".join((ADDON_CLIENT_DIR, "common", sub_path)))
+        for path, sub_path in iter_files(common_dir)
+    )
+    filepaths_to_zip.append(
+        (version_filepath, "/".join((ADDON_CLIENT_DIR, "version.py")))
+    )
+
     zip_filename: str = zip_basename + ".zip"
     zip_filepath: str = os.path.join(os.path.join(private_dir, zip_filename))
-    with ZipFileLongPaths(zip_filepath, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for path, sub_path in find_files_in_subdir(addon_subdir_path):
-            dst_path = "/".join((ADDON_CLIENT_DIR, sub_path))
-            zipf.write(path, dst_path)
-
-        for path, sub_path in find_files_in_subdir(common_dir):
-            dst_path = "/".join((ADDON_CLIENT_DIR, "common", sub_path))
-            zipf.write(path, dst_path)
-
-        zipf.write(
-            version_filepath, os.path.join(ADDON_CLIENT_DIR, "version.py")
-        )
+    with ZipFileLongPaths(
+        zip_filepath,
+        "w",
+        zipfile.ZIP_DEFLATED,
+        compresslevel=compress_level
+    ) as zipf:
+        zip_write_files(zipf, filepaths_to_zip, compress_level)
     shutil.copy(os.path.join(client_dir, "pyproject.toml"), private_dir)
+    return [
+        (zip_filepath, "/".join(("private", zip_filename))),
+        (
+            os.path.join(private_dir, "pyproject.toml"),
+            "/".join(("private", "pyproject.toml"))
+        ),
+    ]
 
 
 def create_server_package(
     output_dir: str,
-    addon_output_dir: str,
+    filepaths: list[tuple[str, str]],
     addon_version: str,
-    log: logging.Logger
+    log: logging.Logger,
+    compress_level: int = DEFAULT_COMPRESS_LEVEL
 ):
     """Create server package zip file.
 
@@ -248,9 +504,11 @@ def create_server_package(
 
     Args:
         output_dir (str): Directory path to output zip file.
-        addon_output_dir (str): Directory path to addon output directory.
+        filepaths (list[tuple[str, str]]): Source file paths with their
+            sub-paths in addon package.
         addon_version (str): Version of addon.
         log (logging.Logger): Logger object.
+        compress_level (int): Compression level of zip file.
     """
 
     log.info("Creating server package")
@@ -261,25 +519,25 @@ def create_server_package(
         "addon_name": ADDON_NAME,
         "addon_version": addon_version
     }
-    with ZipFileLongPaths(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+    with ZipFileLongPaths(
+        output_path,
+        "w",
+        zipfile.ZIP_DEFLATED,
+        compresslevel=compress_level
+    ) as zipf:
         # Write a manifest to zip
-        zipf.writestr("manifest.json", json.dumps(manifest_data, indent=4))
+        zipf.writestr(
+            "manifest.json",
+            json.dumps(manifest_data, separators=(",", ":")).encode("utf-8")
+        )
 
         # Move addon content to zip into 'addon' directory
-        addon_output_dir_offset = len(addon_output_dir) + 1
-        for root, _, filenames in os.walk(addon_output_dir):
-            if not filenames:
-                continue
+        filepaths_to_zip: list[tuple[str, str]] = [
+            (src_path, "addon/" + sub_path)
+            for src_path, sub_path in filepaths
+        ]
 
-            dst_root = "addon"
-            if root != addon_output_dir:
-                dst_root = os.path.join(
-                    dst_root, root[addon_output_dir_offset:]
-                )
-            for filename in filenames:
-                src_path = os.path.join(root, filename)
-                dst_path = os.path.join(dst_root, filename)
-                zipf.write(src_path, dst_path)
+        zip_write_files(zipf, filepaths_to_zip, compress_level)
 
     log.info(f"Output package can be found: {output_path}")
 
@@ -287,7 +545,9 @@ def create_server_package(
 def main(
     output_dir: Optional[str]=None,
     skip_zip: Optional[bool]=False,
-    keep_sources: Optional[bool]=False
+    keep_sources: Optional[bool]=False,
+    compress_level: Optional[int]=DEFAULT_COMPRESS_LEVEL,
+    force: Optional[bool]=False
 ):
     log: logging.Logger = logging.getLogger("create_package")
     log.info("Start creating package")
@@ -303,28 +563,48 @@ def main(
     addon_version: str = version_content["__version__"]
 
     addon_output_root: str = os.path.join(output_dir, ADDON_NAME)
-    if os.path.isdir(addon_output_root):
+    if force and os.path.isdir(addon_output_root):
         log.info(f"Purging {addon_output_root}")
         shutil.rmtree(addon_output_root)
+        _MADE_DIRS.clear()
+    else:
+        remove_other_versions(addon_output_root, addon_version, log)
 
     log.info(f"Preparing package for {ADDON_NAME}-{addon_version}")
     addon_output_dir: str = os.path.join(addon_output_root, addon_version)
     if not os.path.exists(addon_output_dir):
         os.makedirs(addon_output_dir)
 
-    copy_server_content(addon_output_dir, current_dir, log)
+    # Server files are always zipped directly from sources, copy them only
+    #   if the package folder structure is kept
+    copy_files: bool = skip_zip or keep_sources
+    # Nothing to skip in purged package directory
+    server_filepaths: list[tuple[str, str]] = copy_server_content(
+        addon_output_dir,
+        current_dir,
+        log,
+        copy_files=copy_files,
+        incremental=not force
+    )
 
-    zip_client_side(addon_output_dir, current_dir, log)
+    client_filepaths: list[tuple[str, str]] = zip_client_side(
+        addon_output_dir, current_dir, log, compress_level=compress_level
+    )
 
     # Skip server zipping
     if not skip_zip:
         create_server_package(
-            output_dir, addon_output_dir, addon_version, log
+            output_dir,
+            server_filepaths + client_filepaths,
+            addon_version,
+            log,
+            compress_level
         )
         # Remove sources only if zip file is created
         if not keep_sources:
             log.info("Removing source files for server package")
             shutil.rmtree(addon_output_root)
+            _MADE_DIRS.clear()
     log.info("Package creation finished")
 
 
@@ -353,9 +633,39 @@ if __name__ == "__main__":
         default=None,
         help=(
             "Directory path where package will be created"
-            " (Will be purged if already exists!)"
+            " (Unchanged files are kept if already exists, other"
+            " addon versions are removed)"
+        )
+    )
+    parser.add_argument(
+        "--force",
+        dest="force",
+        action="store_true",
+        help=(
+            "Purge existing package directory instead of updating"
+            " only changed files."
+        )
+    )
+
+    parser.add_argument(
+        "--compress-level",
+        dest="compress_level",
+        type=int,
+        choices=range(0, 10),
+        metavar="LEVEL",
+        default=DEFAULT_COMPRESS_LEVEL,
+        help=(
+            "Compression level of zip files (0-9, default"
+            f" {DEFAULT_COMPRESS_LEVEL}). Lower levels are faster, higher"
+            " levels produce smaller files."
         )
     )
 
     args = parser.parse_args(sys.argv[1:])
-    main(args.output_dir, args.skip_zip, args.keep_sources)
+    main(
+        args.output_dir,
+        args.skip_zip,
+        args.keep_sources,
+        args.compress_level,
+        args.force
+    )
@@ -1,5 +1,4 @@
 import os
-import time
 import logging
 import traceback
 import types
@@ -32,6 +31,8 @@ class FtrackServer:
         self.is_running = False
 
         self.handler_paths = handler_paths or []
+        # Loaded modules by path with signature of path content
+        self._modules_cache = {}
 
     def stop_session(self):
         self.stopped = True
@@ -40,34 +41,77 @@ class FtrackServer:
         self.session.close()
         self.session = None
 
+    def _get_path_signature(self, path):
+        """Signature of python files in a directory.
+
+        Args:
+            path (str): Path to directory.
+
+        Returns:
+            Union[tuple, None]: Names, modification times and sizes of python
+                files. None if path is not a directory.
+        """
+        try:
+            with os.scandir(path) as entries:
+                signature = []
+                for entry in entries:
+                    if not entry.name.endswith(".py"):
+                        continue
+                    stat = entry.stat()
+                    signature.append(
+                        (entry.name, stat.st_mtime_ns, stat.st_size)
+                    )
+        except OSError:
+            return None
+        signature.sort()
+        return tuple(signature)
+
+    def _get_modules_from_path(self, path):
+        """Get modules from path, re-use loaded modules if path is unchanged.
+
+        Args:
+            path (str): Path to directory with python files.
+
+        Returns:
+            tuple<list, list>: Imported modules and crashed paths with
+                exception info.
+        """
+        signature = self._get_path_signature(path)
+        cached = self._modules_cache.get(path)
+        if (
+            signature is not None
+            and cached is not None
+            and cached[0] == signature
+        ):
+            return cached[1]
+
+        output = modules_from_path(path)
+        if signature is not None:
+            self._modules_cache[path] = (signature, output)
+        return output
+
     def set_files(self, paths):
         # Iterate all paths
         register_functions = []
         for path in paths:
             # Try to format path with environments
-            try:
-                path = path.format(**os.environ)
-            except BaseException:
-                pass
+            # - 'format_map' does not create copy of environments
+            if "{" in path:
+                try:
+                    path = path.format_map(os.environ)
+                except BaseException:
+                    pass
 
             # Get all modules with functions
-            modules, crashed = modules_from_path(path)
+            modules, crashed = self._get_modules_from_path(path)
             for filepath, exc_info in crashed:
                 self.log.warning("Filepath load crashed {}.\n{}".format(
                     filepath, "".join(traceback.format_exception(*exc_info))
                 ))
 
             for filepath, module in modules:
-                register_function = None
-                for name, attr in module.__dict__.items():
-                    if (
-                        name == "register"
-                        and isinstance(attr, types.FunctionType)
-                    ):
-                        register_function = attr
-                        break
-
-                if not register_function:
+                register_function = getattr(module, "register", None)
+                if not isinstance(register_function, types.FunctionType):
                     self.log.warning(
                         "\"{}\" - Missing register method".format(filepath)
                     )
@@ -112,13 +156,18 @@ class FtrackServer:
             # Use timeout from session (since ftrack-api 2.1.0)
             timeout = getattr(session, "request_timeout", 60)
             self.log.info("Waiting for event hub to connect")
-            started = time.time()
-            while not session.event_hub.connected:
-                if (time.time() - started) > timeout:
-                    raise RuntimeError((
-                        "Connection to Ftrack was not created in {} seconds"
-                    ).format(timeout))
-                time.sleep(0.1)
+            # Thread finishes when event hub connection attempt is done
+            connect_thread = session._auto_connect_event_hub_thread
+            connect_thread.join(timeout)
+            if connect_thread.is_alive():
+                raise RuntimeError((
+                    "Connection to Ftrack was not created in {} seconds"
+                ).format(timeout))
+
+            if not session.event_hub.connected:
+                raise RuntimeError(
+                    "Connection attempt to Ftrack event hub failed"
+                )
 
         elif not session.event_hub.connected:
             self.log.info("Connecting event hub")